@@ -0,0 +1,6 @@
+from two import foo
+from fasthtml.common import fast_app
+app, rt = fast_app()
+@app.get('/')
+def home():
+    return foo()
\ No newline at end of file
@@ -0,0 +1,2 @@
+def foo():
+    return 120 + 3
\ No newline at end of file
@@ -1,8 +1,38 @@
-from importlib.metadata import version
+import importlib
 
-from fh_utils.icons import BoxIcon, FaIcon, HeroIcon, IonIcon, LcIcon, PhIcon  # noqa: F401
-from fh_utils.ipython_ext import load_ipython_extension  # noqa: F401
-from fh_utils.server import no_reload, no_reload_cache, serve  # noqa: F401
-from fh_utils.tailwind import add_daisy_and_tailwind, add_tailwind, tailwind_compile  # noqa: F401
+# Public names are resolved on first access so that `import fh_utils` stays cheap:
+# uvicorn, watchfiles, diskcache and fasthtml are only loaded when actually needed.
+_LAZY_ATTRS = {
+    "BoxIcon": "fh_utils.icons",
+    "FaIcon": "fh_utils.icons",
+    "HeroIcon": "fh_utils.icons",
+    "IonIcon": "fh_utils.icons",
+    "LcIcon": "fh_utils.icons",
+    "PhIcon": "fh_utils.icons",
+    "load_ipython_extension": "fh_utils.ipython_ext",
+    "no_reload": "fh_utils.server",
+    "no_reload_cache": "fh_utils.server",
+    "serve": "fh_utils.server",
+    "add_daisy_and_tailwind": "fh_utils.tailwind",
+    "add_tailwind": "fh_utils.tailwind",
+    "tailwind_compile": "fh_utils.tailwind",
+}
 
-__version__ = version("fh_utils")
+__all__ = ["__version__", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("fh_utils")
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -5,7 +5,7 @@ from typing import Annotated
 import rich
 import typer
 
-from fh_utils import __version__, server
+from fh_utils import server
 
 app = typer.Typer(rich_markup_mode="rich", pretty_exceptions_enable=False)
 logger = getLogger(__name__)
@@ -13,6 +13,8 @@ logger = getLogger(__name__)
 
 def version_callback(value: bool) -> None:
     if value:
+        from fh_utils import __version__
+
         rich.print(f"fh_utils CLI version: [green]{__version__}[/green]")
         raise typer.Exit()
 
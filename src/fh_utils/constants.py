@@ -1,4 +1,4 @@
 from pathlib import Path
 
+# Created lazily by the code that writes into it (icons cache, tailwind cli)
 CACHE_DIR = Path.home() / ".cache/fasthtml"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
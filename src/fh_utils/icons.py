@@ -1,7 +1,8 @@
 import re
+from functools import wraps
+from pathlib import Path
 from typing import Literal
 
-from diskcache import Cache
 from fastcore.meta import delegates
 from fastcore.net import urlread
 from fasthtml.common import NotStr, ft_hx
@@ -9,7 +10,45 @@ from fasthtml.svg import ft_svg
 
 from fh_utils.constants import CACHE_DIR
 
-cache = Cache(CACHE_DIR / "icons")
+
+class _LazyCache:
+    """diskcache.Cache that is only opened (and its directory created) on first use"""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._cache = None
+
+    def __getattr__(self, name):
+        if self._cache is None:
+            from diskcache import Cache
+
+            self._cache = Cache(self.directory)
+        return getattr(self._cache, name)
+
+    def memoize(self, tag: str):
+        """Same as diskcache.Cache.memoize (same keys) without opening the cache at import"""
+
+        def decorator(func):
+            base = (f"{func.__module__}.{func.__qualname__}",)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                from diskcache import ENOVAL
+                from diskcache.core import args_to_key
+
+                key = args_to_key(base, args, kwargs, typed=False, ignore=())
+                result = self.get(key, default=ENOVAL, retry=True)
+                if result is ENOVAL:
+                    result = func(*args, **kwargs)
+                    self.set(key, result, tag=tag, retry=True)
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+cache = _LazyCache(CACHE_DIR / "icons")
 
 
 @cache.memoize(tag="hero")
@@ -7,15 +7,11 @@ import sys
 import threading
 import time
 from dataclasses import dataclass
+from fnmatch import fnmatch
 from functools import lru_cache, wraps
 from pathlib import Path
 
-import uvicorn
-from fasthtml.common import FastHTML, FastHTMLWithLiveReload, Script
-from fasthtml.live_reload import LIVE_RELOAD_SCRIPT
-from uvicorn.supervisors.watchfilesreload import FileFilter
-from watchfiles import watch
-
+# uvicorn, watchfiles and fasthtml are imported where they are used: keep `import fh_utils` cheap.
 logger = logging.getLogger()
 
 
@@ -58,6 +54,8 @@ def serve(
 
 
 def serve_prod(path: Path, app: str, host: str, port: int, **kwargs):
+    import uvicorn
+
     _, use_uvicorn_app = _get_import_string(path=path, app_name=app)
     use_kwargs = dict(app=use_uvicorn_app, host=host, port=port, **kwargs)
     uvicorn.run(**use_kwargs, reload=False)
@@ -72,6 +70,8 @@ def serve_dev(
     reload: ReloadType = ReloadType.FAST,
     **kwargs,
 ):
+    import uvicorn
+
     module_import_str, use_uvicorn_app = _get_import_string(path=path, app_name=app)
     use_kwargs = dict(app=use_uvicorn_app, host=host, port=port, **kwargs)
     if live and reload != ReloadType.FAST:
@@ -95,6 +95,8 @@ def serve_dev(
 def _run_with_fast_reload(
     module_import_str: str, app_str: str, port: int, host: str, live: bool, **kwargs
 ):
+    from fasthtml.common import FastHTML
+
     try:
         from fasthtml.jupyter import nb_serve, wait_port_free
         from IPython.extensions.autoreload import ModuleReloader
@@ -135,7 +137,7 @@ def _run_with_fast_reload(
     global server
 
     server = server_reload(None)
-    watcher = Watcher(**kwargs)
+    watcher = Watcher(roots=_import_roots(), **kwargs)
     try:
         for changes in watcher.loop():
             logger.warning(
@@ -243,39 +245,219 @@ def _display_path(path: Path) -> str:
         return f"'{path}'"
 
 
+# Directory names that are never watched, on top of .gitignore and --reload-exclude
+DEFAULT_WATCH_EXCLUDES = ["__pycache__", "node_modules", "venv", "site-packages"]
+
+
+@dataclass
+class _IgnoreRule:
+    """One line of a .gitignore file (the subset of the syntax that matters for watching)"""
+
+    base: Path
+    pattern: str
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    def match(self, path: Path, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if not self.anchored:
+            return fnmatch(path.name, self.pattern)
+        try:
+            return fnmatch(path.relative_to(self.base).as_posix(), self.pattern)
+        except ValueError:
+            return False
+
+
+def _read_gitignore(directory: Path) -> list[_IgnoreRule]:
+    try:
+        lines = (directory / ".gitignore").read_text(errors="ignore").splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        line = line.removeprefix("!")
+        dir_only = line.endswith("/")
+        line = line.strip("/")
+        if line.startswith("**/"):
+            line = line[3:]
+        if line:
+            rules.append(_IgnoreRule(directory, line, negate, dir_only, anchored="/" in line))
+    return rules
+
+
+def _is_ignored(path: Path, is_dir: bool, rules: list[_IgnoreRule]) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.match(path, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def _parent_gitignore_rules(root: Path) -> list[_IgnoreRule]:
+    """Rules of the .gitignore files above `root`, up to the enclosing git repository"""
+    rules = []
+    for parent in root.parents:
+        rules = _read_gitignore(parent) + rules
+        if (parent / ".git").exists():
+            return rules
+    return []
+
+
+def _import_roots() -> list[Path]:
+    """Directories of the imported modules that do not belong to python or an installed package"""
+    import sysconfig
+
+    installed = {Path(p).resolve() for p in sysconfig.get_paths().values()}
+    dirs = set()
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if not file or not file.endswith(".py"):
+            continue
+        folder = Path(file).resolve().parent
+        if {"site-packages", "dist-packages"} & set(folder.parts):
+            continue
+        if folder in installed or installed & set(folder.parents):
+            continue
+        dirs.add(folder)
+    return _minimal_roots(dirs)
+
+
+def _minimal_roots(dirs) -> list[Path]:
+    dirs = {Path(d).resolve() for d in dirs}
+    return sorted(d for d in dirs if not dirs & set(d.parents))
+
+
 class Watcher:
-    def __init__(self, **kwargs) -> None:
+    """Watch the source directories for changes.
+
+    Ignored trees (.gitignore, --reload-exclude, DEFAULT_WATCH_EXCLUDES) are pruned while listing
+    directories, then each remaining directory is watched non-recursively so the OS never sets up
+    watches inside `.venv`, `node_modules`, data or build folders.
+    """
+
+    def __init__(self, roots: list[Path] | None = None, **kwargs) -> None:
+        import uvicorn
+        from uvicorn.supervisors.watchfilesreload import FileFilter
+
+        start = time.perf_counter()
         # We try to mimic as much as possible uvicorn behavior
         config = uvicorn.Config("dummy", **{**kwargs, "log_level": "critical", "reload": True})
-        reload_dirs = []
-        for directory in config.reload_dirs:
-            if Path.cwd() not in directory.parents:
-                reload_dirs.append(directory)
-        if Path.cwd() not in reload_dirs:
-            reload_dirs.append(Path.cwd())
+        self.watch_filter = FileFilter(config)
+        self.excludes = DEFAULT_WATCH_EXCLUDES + self.watch_filter.excludes
+        self.exclude_dirs = {
+            p.resolve() for p in [*self.watch_filter.exclude_dirs, *config.reload_dirs_excludes]
+        }
+
+        roots = [Path.cwd()] if roots is None else list(roots)
+        if kwargs.get("reload_dirs"):
+            roots.extend(config.reload_dirs)
+        self.roots = _minimal_roots(roots)
+
+        self.dirs: dict[Path, list[_IgnoreRule]] = {}
+        for root in self.roots:
+            self._add_tree(root, _parent_gitignore_rules(root))
 
         self.should_exit = threading.Event()
+        self._start()
+        self.stats = {
+            "dirs": len(self.dirs),
+            "startup_ms": (time.perf_counter() - start) * 1000,
+            "batches": 0,
+            "events": 0,
+            "event_cpu_ms": 0.0,
+        }
+        logger.info(
+            "Watching %d directories in %s (setup %.1f ms)",
+            self.stats["dirs"],
+            ", ".join(map(_display_path, self.roots)),
+            self.stats["startup_ms"],
+        )
+
+    def _add_tree(self, root: Path, rules: list[_IgnoreRule]):
+        stack = [(root, rules)]
+        while stack:
+            folder, rules = stack.pop()
+            rules = rules + _read_gitignore(folder)
+            self.dirs[folder] = rules
+            try:
+                children = [Path(e.path) for e in os.scandir(folder) if e.is_dir()]
+            except OSError:
+                continue
+            stack.extend((c, rules) for c in children if not self._is_excluded(c, rules))
+
+    def _is_excluded(self, folder: Path, rules: list[_IgnoreRule]) -> bool:
+        if folder in self.exclude_dirs or any(fnmatch(folder.name, p) for p in self.excludes):
+            return True
+        return _is_ignored(folder, True, rules)
+
+    def _start(self):
+        from watchfiles import watch
+
         self.watcher = watch(
-            *reload_dirs,
+            *self.dirs,
             watch_filter=None,
             stop_event=self.should_exit,
             yield_on_timeout=True,
             raise_interrupt=False,
+            recursive=False,
         )
-        self.watch_filter = FileFilter(config)
+
+    def _accept(self, path: Path) -> bool:
+        rules = self.dirs.get(path.parent)
+        if rules is None or _is_ignored(path, False, rules):
+            return False
+        return self.watch_filter(path)
 
     def loop(self):
-        for changes in self.watcher:
-            unique_paths = {Path(c[1]) for c in changes}
-            changes = [p for p in unique_paths if self.watch_filter(p)]
-            if changes:
-                yield changes
+        while not self.should_exit.is_set():
+            for changes in self.watcher:
+                start = time.process_time()
+                unique_paths = {Path(c[1]) for c in changes}
+                new_dirs = [
+                    p
+                    for p in unique_paths
+                    if p not in self.dirs
+                    and p.parent in self.dirs
+                    and p.is_dir()
+                    and not self._is_excluded(p, self.dirs[p.parent])
+                ]
+                for folder in new_dirs:
+                    self._add_tree(folder, self.dirs[folder.parent])
+                changes = [p for p in unique_paths if self._accept(p)]
+                self.stats["event_cpu_ms"] += (time.process_time() - start) * 1000
+                self.stats["events"] += len(unique_paths)
+                if changes:
+                    self.stats["batches"] += 1
+                    yield changes
+                if new_dirs:
+                    # non-recursive watches: restart to pick up the new directories
+                    self.dirs = {k: v for k, v in self.dirs.items() if k.is_dir()}
+                    self.stats["dirs"] = len(self.dirs)
+                    self.watcher.close()
+                    self._start()
+                    break
+            else:
+                return
 
     def shutdown(self):
         self.should_exit.set()
+        logger.info(
+            "Watcher processed %d events in %.1f ms of CPU",
+            self.stats["events"],
+            self.stats["event_cpu_ms"],
+        )
 
 
 def _add_live_reload(app, kwargs):
+    from fasthtml.common import FastHTMLWithLiveReload, Script
+    from fasthtml.live_reload import LIVE_RELOAD_SCRIPT
+
     if hasattr(app, "LIVE_RELOAD_HEADER"):
         return
 
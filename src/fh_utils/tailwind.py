@@ -106,6 +106,7 @@ def _cached_download_tailwind_cli(version="latest") -> Path:
     if path.exists():
         return path
     url = _get_download_url(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
     urlsave(url, path)
     path.chmod(path.stat().st_mode | stat.S_IEXEC)
     return path
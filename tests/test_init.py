@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import fh_utils
+
+# Budgets in microseconds (cumulative import time reported by `python -X importtime`)
+IMPORT_BUDGETS = {"fh_utils": 20_000, "fh_utils.cli": 150_000}
+HEAVY_MODULES = ("uvicorn", "watchfiles", "diskcache", "fasthtml", "IPython")
+
+
+def _importtime(module: str) -> dict[str, int]:
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    res = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            res[name.strip()] = int(cumulative)
+    return res
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS))
+def test_import_time(module):
+    # best of 3 to absorb noise from a cold disk cache
+    runs = [_importtime(module) for _ in range(3)]
+    assert min(r[module] for r in runs) < IMPORT_BUDGETS[module]
+    assert not [m for m in runs[0] if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_lazy_attributes():
+    from fh_utils import server
+
+    assert fh_utils.serve is server.serve
+    assert fh_utils.no_reload_cache is server.no_reload_cache
+    assert isinstance(fh_utils.__version__, str)
+    assert "add_tailwind" in dir(fh_utils)
+    with pytest.raises(AttributeError):
+        fh_utils.does_not_exist
+
+
+def test_no_import_side_effects():
+    code = "from fh_utils import icons; assert icons.cache._cache is None"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -16,7 +16,7 @@ import pytest
 from inline_snapshot import snapshot
 
 from fh_utils import serve
-from fh_utils.server import _terminate, serve_prod
+from fh_utils.server import Watcher, _import_roots, _terminate, serve_prod
 
 PORT = 7951
 DEMO2_CODE = Path("examples/demo2.py").read_text()
@@ -153,6 +153,27 @@ def test_dev_full_reload(mock):
     mock.assert_called_once()
 
 
+def test_watcher__ignored_dirs(tmp_path):
+    for d in ["src/pkg/sub", "node_modules/x", ".venv/lib", "data/big", "build", "src/gen"]:
+        (tmp_path / d).mkdir(parents=True)
+    (tmp_path / ".gitignore").write_text("# comment\ndata/\n/build\n")
+    (tmp_path / "src/.gitignore").write_text("gen\n*.gen.py\n")
+
+    watcher = Watcher(roots=[tmp_path])
+    dirs = sorted(p.relative_to(tmp_path).as_posix() for p in watcher.dirs)
+    assert dirs == snapshot([".", "src", "src/pkg", "src/pkg/sub"])
+    assert watcher._accept(tmp_path / "src/pkg/a.py")
+    assert not watcher._accept(tmp_path / "src/pkg/a.gen.py")
+    assert not watcher._accept(tmp_path / "data/big/a.py")
+    watcher.shutdown()
+
+
+def test_import_roots():
+    roots = _import_roots()
+    assert Path(__file__).parent.resolve() in roots
+    assert not [p for p in roots if "site-packages" in p.parts]
+
+
 def wait_and_test(p, exp):
     for _ in range(50):
         if p and p.poll() is not None: